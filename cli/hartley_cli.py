@@ -1,27 +1,124 @@
 #!/usr/bin/env python3
 import sys
 import json
+import asyncio
 import argparse
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Shared session so repeated requests reuse keep-alive connections.
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=Retry(total=3, backoff_factor=0.2))
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+
+def send_action(url, payload):
+    response = _SESSION.post(url, json=payload, timeout=(3, 30))
+    return response.json()
+
+def load_actions_file(path):
+    # Each non-empty line is a JSON object: {"action": ..., "params": {...}}.
+    payloads = []
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            payloads.append({"action": record["action"], "params": record.get("params", {})})
+    return payloads
+
+def send_batch(url, payloads):
+    # httpx is only needed for batch mode, so import it lazily.
+    import httpx
+    try:
+        import h2  # noqa: F401
+        http2 = True
+    except ImportError:
+        http2 = False
+
+    max_connections = 100
+
+    async def _run():
+        # Waiting for a free connection is not counted against the request timeout.
+        client = httpx.AsyncClient(
+            http2=http2,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=20),
+            timeout=httpx.Timeout(30.0, pool=None),
+        )
+        # Bound the number of in-flight requests to the connection pool size.
+        semaphore = asyncio.Semaphore(max_connections)
+
+        async def fire(payload):
+            async with semaphore:
+                response = await client.post(url, json=payload)
+            return response.json()
+
+        try:
+            return await asyncio.gather(*(fire(p) for p in payloads), return_exceptions=True)
+        finally:
+            await client.aclose()
+
+    return asyncio.run(_run())
 
 def main():
     parser = argparse.ArgumentParser(description="Hartley CLI")
     parser.add_argument("--server", default="http://localhost:8080", help="Hartley server address")
-    parser.add_argument("--action", required=True, help="Action to perform")
-    parser.add_argument("--params", default="{}", help="JSON string of parameters for the action")
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--action", help="Action to perform")
+    group.add_argument("--actions-file", help="JSONL file of actions to send over one session")
+    group.add_argument("--batch", help="JSONL file of actions to send concurrently")
+    parser.add_argument("--params", help="JSON string of parameters for the action (only with --action)")
     args = parser.parse_args()
+    if args.params is not None and not args.action:
+        parser.error("--params can only be used with --action; put params in each line of the file instead")
+
+    url = f"{args.server}/api/action"
+
+    if args.batch:
+        try:
+            payloads = load_actions_file(args.batch)
+        except Exception as e:
+            print(f"Error reading batch file: {e}")
+            sys.exit(1)
+        try:
+            results = send_batch(url, payloads)
+        except ImportError:
+            print("Error: --batch requires httpx (pip install httpx)")
+            sys.exit(1)
+        except Exception as e:
+            print(f"Error contacting server: {e}")
+            sys.exit(1)
+        for result in results:
+            if isinstance(result, Exception):
+                print(f"Error contacting server: {result}")
+            else:
+                print(json.dumps(result, indent=2))
+        return
+
+    if args.actions_file:
+        try:
+            payloads = load_actions_file(args.actions_file)
+        except Exception as e:
+            print(f"Error reading actions file: {e}")
+            sys.exit(1)
+        for payload in payloads:
+            try:
+                print(json.dumps(send_action(url, payload), indent=2))
+            except Exception as e:
+                print(f"Error contacting server: {e}")
+        return
 
     try:
-        params = json.loads(args.params)
+        params = json.loads("{}" if args.params is None else args.params)
     except Exception as e:
         print(f"Error parsing parameters: {e}")
         sys.exit(1)
 
     payload = {"action": args.action, "params": params}
-    url = f"{args.server}/api/action"
     try:
-        response = requests.post(url, json=payload)
-        print(json.dumps(response.json(), indent=2))
+        print(json.dumps(send_action(url, payload), indent=2))
     except Exception as e:
         print(f"Error contacting server: {e}")
 
@@ -3,14 +3,18 @@ package main
 import (
 	"bytes"
 	"database/sql"
+	"encoding/binary"
 	"encoding/json"
 	"errors"
 	"fmt"
+	"io"
 	"io/ioutil"
 	"log"
+	"net"
 	"net/http"
 	"os"
 	"os/exec"
+	"path/filepath"
 	"strings"
 	"time"
 
@@ -26,6 +30,7 @@ type Config struct {
 	ServerPort     int    `json:"server_port"`
 	GeminiAPIKey   string `json:"gemini_api_key"`
 	GeminiEndpoint string `json:"gemini_endpoint"`
+	ActionSocket   string `json:"action_socket"`
 }
 
 type Action struct {
@@ -148,6 +153,47 @@ func runPython(args ...string) ([]byte, error) {
 	return out, err
 }
 
+// errDaemonUnavailable means the action daemon could not be reached, so the action was never sent.
+var errDaemonUnavailable = errors.New("action daemon unavailable")
+
+// actionDaemonTimeout bounds a whole round-trip to the action daemon, including the action itself.
+const actionDaemonTimeout = 5 * time.Minute
+
+// runActionDaemon sends an action to a running "action_runner.py --daemon" over its Unix socket.
+// Messages in both directions are a 4-byte big-endian length followed by a JSON object.
+// Only a failure to connect wraps errDaemonUnavailable; once the request is sent the action
+// may already have run, so any later error must not be retried.
+func runActionDaemon(function string, params map[string]interface{}) ([]byte, error) {
+	msg, err := json.Marshal(map[string]interface{}{"function": function, "params": params})
+	if err != nil {
+		return nil, err
+	}
+
+	conn, err := net.DialTimeout("unix", config.ActionSocket, 2*time.Second)
+	if err != nil {
+		return nil, fmt.Errorf("%w: %v", errDaemonUnavailable, err)
+	}
+	defer conn.Close()
+	if err := conn.SetDeadline(time.Now().Add(actionDaemonTimeout)); err != nil {
+		return nil, err
+	}
+
+	header := make([]byte, 4)
+	binary.BigEndian.PutUint32(header, uint32(len(msg)))
+	if _, err := conn.Write(append(header, msg...)); err != nil {
+		return nil, err
+	}
+
+	if _, err := io.ReadFull(conn, header); err != nil {
+		return nil, err
+	}
+	out := make([]byte, binary.BigEndian.Uint32(header))
+	if _, err := io.ReadFull(conn, out); err != nil {
+		return nil, err
+	}
+	return out, nil
+}
+
 // actionHandler processes incoming action requests.
 func actionHandler(w http.ResponseWriter, r *http.Request) {
 	// Ensure only POST requests are accepted.
@@ -178,8 +224,18 @@ func actionHandler(w http.ResponseWriter, r *http.Request) {
 				resp = map[string]interface{}{"error": "Error marshalling parameters"}
 				break
 			}
-			// Execute the defined Python script using fallback for python3/python/py.
-			output, err := runPython(act.Script, act.Function, string(paramsJSON))
+			// Use the action_runner daemon when configured; otherwise (or if it cannot be reached)
+			// execute the defined Python script using fallback for python3/python/py.
+			var output []byte
+			if config.ActionSocket != "" && filepath.Base(act.Script) == "action_runner.py" {
+				output, err = runActionDaemon(act.Function, req.Params)
+				if errors.Is(err, errDaemonUnavailable) {
+					log.Printf("%v, falling back to python", err)
+					output, err = runPython(act.Script, act.Function, string(paramsJSON))
+				}
+			} else {
+				output, err = runPython(act.Script, act.Function, string(paramsJSON))
+			}
 			if err != nil {
 				resp = map[string]interface{}{
 					"error":  fmt.Sprintf("Error executing action: %v", err),
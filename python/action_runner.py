@@ -1,7 +1,25 @@
 #!/usr/bin/env python3
+import os
 import sys
 import json
+import stat
+import signal
+import socket
+import struct
+import argparse
 import subprocess
+import socketserver
+
+# Daemon frames use orjson when available. Parameters on argv and results on
+# stdout stay on the stdlib json module so they keep its exact-integer parsing
+# and ASCII-escaped output.
+try:
+    import orjson
+    _frame_dumps = orjson.dumps
+    _frame_loads = orjson.loads
+except ImportError:
+    _frame_dumps = lambda o: json.dumps(o).encode()
+    _frame_loads = json.loads
 
 def run_terminal_command(params):
     # Expects a "command" field in params.
@@ -18,23 +36,34 @@ def run_terminal_command(params):
     except Exception as e:
         return {"error": str(e)}
 
-def create_website(params):
-    # Create a simple HTML file.
-    title = params.get("title", "My Website")
-    body  = params.get("body", "<p>Hello, World!</p>")
-    html_content = f"""<!DOCTYPE html>
+# Static parts of the website template, pre-encoded once.
+_HTML_HEAD = b"""<!DOCTYPE html>
 <html>
 <head>
   <meta charset="utf-8">
-  <title>{title}</title>
+  <title>"""
+_HTML_MID = b"""</title>
 </head>
 <body>
-  {body}
+  """
+_HTML_TAIL = b"""
 </body>
 </html>"""
+
+def create_website(params):
+    # Create a simple HTML file.
+    title = params.get("title", "My Website")
+    body  = params.get("body", "<p>Hello, World!</p>")
     try:
-        with open("website.html", "w") as f:
-            f.write(html_content)
+        data = b"".join([_HTML_HEAD, str(title).encode("utf-8"), _HTML_MID, str(body).encode("utf-8"), _HTML_TAIL])
+        fd = os.open("website.html", os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            # os.write may write fewer bytes than asked, so keep going until done.
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
         return {"message": "Website created successfully", "file": "website.html"}
     except Exception as e:
         return {"error": str(e)}
@@ -44,7 +73,105 @@ def turn_on_lights(params):
     # Here we simulate the action.
     return {"message": "Living room lights turned on"}
 
+_DISPATCH = {
+    "run_terminal_command": run_terminal_command,
+    "create_website": create_website,
+    "turn_on_lights": turn_on_lights,
+}
+
+def _unknown_function(params):
+    return {"error": "Unknown function"}
+
+def dispatch(function, params):
+    return _DISPATCH.get(function, _unknown_function)(params)
+
+class ActionRequestHandler(socketserver.StreamRequestHandler):
+    # Each frame is a 4-byte big-endian length followed by a JSON object
+    # {"function": ..., "params": {...}}; the reply uses the same framing.
+    def handle(self):
+        while True:
+            header = self.rfile.read(4)
+            if len(header) < 4:
+                return
+            (length,) = struct.unpack(">I", header)
+            body = self.rfile.read(length)
+            try:
+                message = _frame_loads(body)
+                result = dispatch(message.get("function"), message.get("params") or {})
+            except Exception as e:
+                result = {"error": f"Invalid request: {e}"}
+            data = _frame_dumps(result)
+            try:
+                self.wfile.write(struct.pack(">I", len(data)) + data)
+                self.wfile.flush()
+            except (BrokenPipeError, ConnectionResetError):
+                # The client gave up (e.g. the server's deadline passed) before the reply.
+                return
+
+def clear_stale_socket(socket_path):
+    # Remove a socket left behind by a previous run. Returns an error message
+    # if the path is in use or is not a socket, in which case it is left alone.
+    try:
+        mode = os.stat(socket_path).st_mode
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        return f"Cannot inspect {socket_path}: {e}"
+    if not stat.S_ISSOCK(mode):
+        return f"{socket_path} exists and is not a socket"
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(socket_path)
+    except ConnectionRefusedError:
+        try:
+            os.unlink(socket_path)
+        except OSError as e:
+            return f"Cannot remove stale socket {socket_path}: {e}"
+        return None
+    except OSError as e:
+        return f"Cannot probe {socket_path}: {e}"
+    finally:
+        probe.close()
+    return f"Another daemon is already listening on {socket_path}"
+
+def serve(socket_path):
+    error = clear_stale_socket(socket_path)
+    if error:
+        print(json.dumps({"error": error}))
+        sys.exit(1)
+
+    # The socket runs arbitrary shell commands, so only the owner may connect.
+    old_umask = os.umask(0o177)
+    try:
+        server = socketserver.ThreadingUnixStreamServer(socket_path, ActionRequestHandler)
+    except OSError as e:
+        print(json.dumps({"error": f"Cannot listen on {socket_path}: {e}"}))
+        sys.exit(1)
+    finally:
+        os.umask(old_umask)
+    os.chmod(socket_path, 0o600)
+    server.daemon_threads = True
+
+    # Turn SIGTERM into SystemExit so the socket is removed below.
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        try:
+            os.unlink(socket_path)
+        except FileNotFoundError:
+            pass
+
 def main():
+    if "--daemon" in sys.argv[1:]:
+        parser = argparse.ArgumentParser(description="Hartley action runner daemon")
+        parser.add_argument("--daemon", action="store_true", help="Serve actions over a Unix socket")
+        parser.add_argument("--socket", default="/tmp/hartley.sock", help="Unix socket path to listen on")
+        args = parser.parse_args()
+        serve(args.socket)
+        return
+
     if len(sys.argv) < 3:
         print(json.dumps({"error": "Insufficient arguments"}))
         sys.exit(1)
@@ -55,15 +182,7 @@ def main():
         print(json.dumps({"error": "Invalid JSON for parameters"}))
         sys.exit(1)
 
-    if function == "run_terminal_command":
-        result = run_terminal_command(params)
-    elif function == "create_website":
-        result = create_website(params)
-    elif function == "turn_on_lights":
-        result = turn_on_lights(params)
-    else:
-        result = {"error": "Unknown function"}
-    print(json.dumps(result))
+    print(json.dumps(dispatch(function, params)))
 
 if __name__ == "__main__":
     main()